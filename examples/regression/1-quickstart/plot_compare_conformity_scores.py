@@ -33,12 +33,14 @@ intervals are narrower than the default ones, conversely to high prices
 for which the confidence intervals are higher but visually more relevant.
 The empirical coverage is similar between the two conformity scores.
 """
+import os
+import tempfile
 import matplotlib.pyplot as plt
 import numpy as np
 import requests
 import zipfile
-import io
 import pandas as pd
+from sklearn.datasets import get_data_home
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.model_selection import train_test_split
 
@@ -68,21 +70,33 @@ model = RandomForestRegressor(**rf_kwargs)
 # We start by loading a dataset with a target following approximately
 # a Gamma distribution.
 # Two sub datasets are extracted: the training and test ones.
+# The archive is cached in the scikit-learn data home, so that it is only
+# downloaded once.
 
 dataset_url = (
     "https://www.kaggle.com" +
     "/api/v1/datasets/download/shashanknecrothapa/ames-housing-dataset"
 )
-r = requests.get(dataset_url, stream=True)
-with zipfile.ZipFile(io.BytesIO(r.content)) as z:
+dataset_path = os.path.join(get_data_home(), "ames-housing-dataset.zip")
+if not os.path.exists(dataset_path):
+    r = requests.get(dataset_url)
+    r.raise_for_status()
+    # Write to a temporary file first so that an interrupted download
+    # never leaves a truncated archive in the cache
+    with tempfile.NamedTemporaryFile(
+        dir=os.path.dirname(dataset_path), delete=False
+    ) as f:
+        f.write(r.content)
+    os.replace(f.name, dataset_path)
+with zipfile.ZipFile(dataset_path) as z:
     with z.open("AmesHousing.csv") as file:
         data = pd.read_csv(file)
 
-X = data[features]
-y = data[target]
+X = data[features].to_numpy(dtype=np.float32)
+y = data[target].to_numpy()
 
 X_train_conformalize, X_test, y_train_conformalize, y_test = train_test_split(
-    X[features], y, test_size=0.2, random_state=RANDOM_STATE
+    X, y, test_size=0.2, random_state=RANDOM_STATE
 )
 
 ##############################################################################
@@ -104,7 +118,7 @@ X_train_conformalize, X_test, y_train_conformalize, y_test = train_test_split(
 # First, train model with
 # conformity_score = "absolute".
 mapie = CrossConformalRegressor(
-    model, confidence_level=confidence_level, conformity_score="absolute"
+    model, confidence_level=confidence_level, conformity_score="absolute", n_jobs=-1
 )
 mapie.fit_conformalize(X_train_conformalize, y_train_conformalize)
 y_pred_absconfscore, y_pis_absconfscore = mapie.predict_interval(
@@ -120,26 +134,21 @@ coverage_absconfscore = regression_coverage_score(
 # corresponding widths.
 
 
-def get_yerr(y_pred, y_pis):
-    return np.concatenate(
-        [
-            np.expand_dims(y_pred, 0) - y_pis[:, 0, 0].T,
-            y_pis[:, 1, 0].T - np.expand_dims(y_pred, 0),
-        ],
-        axis=0,
-    )
+def get_yerr_and_width(y_pred, y_pis):
+    y_low, y_up = y_pis[:, 0, 0], y_pis[:, 1, 0]
+    yerr = np.stack((y_pred - y_low, y_up - y_pred))
+    return yerr, y_up - y_low
 
 
-yerr_absconfscore = get_yerr(y_pred_absconfscore, y_pis_absconfscore)
-pred_int_width_absconfscore = (
-    y_pis_absconfscore[:, 1, 0] - y_pis_absconfscore[:, 0, 0]
+yerr_absconfscore, pred_int_width_absconfscore = get_yerr_and_width(
+    y_pred_absconfscore, y_pis_absconfscore
 )
 
 ##############################################################################
 # Then, train the model with:
 # `conformity_score = "gamma"`.
 mapie = CrossConformalRegressor(
-    model, confidence_level=confidence_level, conformity_score="gamma"
+    model, confidence_level=confidence_level, conformity_score="gamma", n_jobs=-1
 )
 mapie.fit_conformalize(X_train_conformalize, y_train_conformalize)
 y_pred_gammaconfscore, y_pis_gammaconfscore = mapie.predict_interval(
@@ -150,9 +159,8 @@ coverage_gammaconfscore = regression_coverage_score(
     y_test, y_pis_gammaconfscore
 )[0]
 
-yerr_gammaconfscore = get_yerr(y_pred_gammaconfscore, y_pis_gammaconfscore)
-pred_int_width_gammaconfscore = (
-    y_pis_gammaconfscore[:, 1, 0] - y_pis_gammaconfscore[:, 0, 0]
+yerr_gammaconfscore, pred_int_width_gammaconfscore = get_yerr_and_width(
+    y_pred_gammaconfscore, y_pis_gammaconfscore
 )
 
 
@@ -169,6 +177,9 @@ pred_int_width_gammaconfscore = (
 #
 # The choice of the conformity score depends on the problem we face.
 
+order = np.argsort(y_test)
+y_test_sorted = y_test[order]
+
 fig, axs = plt.subplots(2, 2, figsize=(10, 10))
 
 for img_id, y_pred, y_err, cov, class_name, int_width in zip(
@@ -179,19 +190,17 @@ for img_id, y_pred, y_err, cov, class_name, int_width in zip(
     ["AbsoluteResidualScore", "GammaResidualScore"],
     [pred_int_width_absconfscore, pred_int_width_gammaconfscore],
 ):
+    y_pred, y_err, int_width = y_pred[order], y_err[:, order], int_width[order]
     axs[0, img_id].errorbar(
-        y_test,
+        y_test_sorted,
         y_pred,
         yerr=y_err,
         alpha=0.5,
         linestyle="None",
     )
-    axs[0, img_id].scatter(y_test, y_pred, s=1, color="black")
-    axs[0, img_id].plot(
-        [0, max(max(y_test), max(y_pred))],
-        [0, max(max(y_test), max(y_pred))],
-        "-r",
-    )
+    axs[0, img_id].scatter(y_test_sorted, y_pred, s=1, color="black")
+    lim = max(float(y_test_sorted[-1]), float(y_pred.max()))
+    axs[0, img_id].plot([0, lim], [0, lim], "-r")
     axs[0, img_id].set_xlabel("Actual price [$]")
     axs[0, img_id].set_ylabel("Predicted price [$]")
     axs[0, img_id].grid()
@@ -199,7 +208,7 @@ for img_id, y_pred, y_err, cov, class_name, int_width in zip(
 
     xmin, xmax = axs[0, img_id].get_xlim()
     ymin, ymax = axs[0, img_id].get_ylim()
-    axs[1, img_id].scatter(y_test, int_width, marker="+")
+    axs[1, img_id].scatter(y_test_sorted, int_width, marker="+")
     axs[1, img_id].set_xlabel("Actual price [$]")
     axs[1, img_id].set_ylabel("Prediction interval width [$]")
     axs[1, img_id].grid()
@@ -40,12 +40,14 @@ plt.ylabel("y")
 plt.scatter(X_test, y_test, alpha=0.3)
 plt.plot(X_test, y_pred, color="C1")
 order = np.argsort(X_test[:, 0])
-plt.plot(X_test[order], y_pred_interval[order][:, 0, 1], color="C1", ls="--")
-plt.plot(X_test[order], y_pred_interval[order][:, 1, 1], color="C1", ls="--")
+X_test_sorted = X_test[order]
+y_pred_interval_sorted = y_pred_interval[order]
+plt.plot(X_test_sorted, y_pred_interval_sorted[:, 0, 1], color="C1", ls="--")
+plt.plot(X_test_sorted, y_pred_interval_sorted[:, 1, 1], color="C1", ls="--")
 plt.fill_between(
-    X_test[order].ravel(),
-    y_pred_interval[order][:, 0, 0].ravel(),
-    y_pred_interval[order][:, 1, 0].ravel(),
+    X_test_sorted.ravel(),
+    y_pred_interval_sorted[:, 0, 0],
+    y_pred_interval_sorted[:, 1, 0],
     alpha=0.2,
 )
 plt.title(
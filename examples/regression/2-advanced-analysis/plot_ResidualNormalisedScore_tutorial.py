@@ -221,12 +221,8 @@ def yerr(y_pred, intervals) -> ArrayLike:
     ArrayLike
         Error bars.
     """
-    return np.abs(np.concatenate(
-        [
-            np.expand_dims(y_pred, 0) - intervals[:, 0, 0].T,
-            intervals[:, 1, 0].T - np.expand_dims(y_pred, 0),
-        ],
-        axis=0,
+    return np.abs(np.stack(
+        (y_pred - intervals[:, 0, 0], intervals[:, 1, 0] - y_pred)
     ))
 
 
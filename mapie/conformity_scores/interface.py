@@ -5,6 +5,7 @@ import numpy as np
 from sklearn.base import BaseEstimator
 
 from numpy.typing import NDArray
+from mapie.utils import _compute_histogram_quantile, _compute_lower_quantile
 
 
 class BaseConformityScore(metaclass=ABCMeta):
@@ -101,7 +102,8 @@ class BaseConformityScore(metaclass=ABCMeta):
         alpha_np: NDArray,
         axis: int = 0,
         reversed: bool = False,
-        unbounded: bool = False
+        unbounded: bool = False,
+        quantile_method: str = "exact"
     ) -> NDArray:
         """
         Compute the alpha quantile of the conformity scores.
@@ -132,12 +134,22 @@ class BaseConformityScore(metaclass=ABCMeta):
 
             By default ``False``.
 
+        quantile_method: str
+            Method used to compute the quantiles, either ``"exact"`` or
+            ``"histogram"``. With ``"histogram"``, the conformity scores
+            are binned once and each quantile is rounded outwards to the
+            edge of its bin, which is faster on large calibration sets and
+            gives intervals at most one bin wider than the exact ones.
+            Matrices of conformity scores (``axis=1``) always use exact
+            quantiles.
+
+            By default ``"exact"``.
+
         Returns
         -------
         NDArray of shape (1, n_alpha) or (n_samples, n_alpha)
             The quantiles of the conformity scores.
         """
-        n_ref = conformity_scores.shape[1-axis]
         n_calib: int = np.min(np.sum(~np.isnan(conformity_scores), axis=axis))
         signed = 1-2*reversed
 
@@ -149,17 +161,23 @@ class BaseConformityScore(metaclass=ABCMeta):
         alpha_cor = np.clip(alpha_cor, a_min=0, a_max=1)
 
         # Compute the target quantiles:
+        # The quantile is calculated as the corrected lower quantile
+        # of the signed conformity scores.
         # If unbounded is True and alpha is greater than or equal to 1,
         # the quantile is set to infinity.
-        # Otherwise, the quantile is calculated as the corrected lower quantile
-        # of the signed conformity scores.
-        quantile = signed * np.column_stack([
-            np.nanquantile(
-                signed * conformity_scores, _alpha_cor,
-                axis=axis, method="lower"
-            ) if not (unbounded and _alpha >= 1) else np.inf * np.ones(n_ref)
-            for _alpha, _alpha_cor in zip(alpha_ref, alpha_cor)
-        ])
+        if quantile_method == "histogram":
+            quantiles = signed * _compute_histogram_quantile(
+                signed * conformity_scores, alpha_cor, axis=axis
+            )
+        else:
+            quantiles = _compute_lower_quantile(
+                conformity_scores, alpha_cor, axis=axis, reversed=reversed
+            )
+        if unbounded:
+            quantiles = np.where(
+                (alpha_ref >= 1)[..., np.newaxis], signed * np.inf, quantiles
+            )
+        quantile = np.column_stack(list(quantiles))
         return quantile
 
     @abstractmethod
@@ -264,7 +264,8 @@ class BaseRegressionScore(BaseConformityScore, metaclass=ABCMeta):
         ensemble: bool = False,
         method: str = 'base',
         optimize_beta: bool = False,
-        allow_infinite_bounds: bool = False
+        allow_infinite_bounds: bool = False,
+        quantile_method: str = "exact"
     ) -> Tuple[NDArray, NDArray, NDArray]:
         """
         Compute bounds of the prediction intervals from the observed values,
@@ -309,6 +310,12 @@ class BaseRegressionScore(BaseConformityScore, metaclass=ABCMeta):
 
             By default ``False``.
 
+        quantile_method: str
+            Method used to compute the quantiles of the conformity scores,
+            either ``"exact"`` or ``"histogram"`` (approximation).
+
+            By default ``"exact"``.
+
         Returns
         -------
         Tuple[NDArray, NDArray, NDArray]
@@ -353,18 +360,21 @@ class BaseRegressionScore(BaseConformityScore, metaclass=ABCMeta):
             )
             bound_low = self.get_quantile(
                 conformity_scores_low, alpha_low, axis=1, reversed=True,
-                unbounded=allow_infinite_bounds
+                unbounded=allow_infinite_bounds,
+                quantile_method=quantile_method
             )
             bound_up = self.get_quantile(
                 conformity_scores_up, alpha_up, axis=1,
-                unbounded=allow_infinite_bounds
+                unbounded=allow_infinite_bounds,
+                quantile_method=quantile_method
             )
 
         else:
             if self.sym:
                 alpha_ref = 1-alpha_np
                 quantile_ref = self.get_quantile(
-                    conformity_scores[..., np.newaxis], alpha_ref, axis=0
+                    conformity_scores[..., np.newaxis], alpha_ref, axis=0,
+                    quantile_method=quantile_method
                 )
                 quantile_low, quantile_up = -quantile_ref, quantile_ref
 
@@ -374,12 +384,14 @@ class BaseRegressionScore(BaseConformityScore, metaclass=ABCMeta):
                 quantile_low = self.get_quantile(
                     conformity_scores[..., np.newaxis],
                     alpha_low, axis=0, reversed=True,
-                    unbounded=allow_infinite_bounds
+                    unbounded=allow_infinite_bounds,
+                    quantile_method=quantile_method
                 )
                 quantile_up = self.get_quantile(
                     conformity_scores[..., np.newaxis],
                     alpha_up, axis=0,
-                    unbounded=allow_infinite_bounds
+                    unbounded=allow_infinite_bounds,
+                    quantile_method=quantile_method
                 )
 
             bound_low = self.get_estimation_distribution(
@@ -124,13 +124,9 @@ def regression_coverage_score(
     if len(y_true.shape) != 2:
         y_true = cast(NDArray, column_or_1d(y_true))
         y_true = np.expand_dims(y_true, axis=1)
-    coverages = np.mean(
-        np.logical_and(
-            np.less_equal(y_intervals[:, 0, :], y_true),
-            np.greater_equal(y_intervals[:, 1, :], y_true)
-        ),
-        axis=0
-    )
+    covered = np.less_equal(y_intervals[:, 0, :], y_true)
+    covered &= np.greater_equal(y_intervals[:, 1, :], y_true)
+    coverages = np.count_nonzero(covered, axis=0) / len(covered)
     return coverages
 
 
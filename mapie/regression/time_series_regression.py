@@ -68,6 +68,7 @@ class TimeSeriesRegressor(_MapieRegressor):
         verbose: int = 0,
         conformity_score: Optional[BaseRegressionScore] = None,
         random_state: Optional[Union[int, np.random.RandomState]] = None,
+        quantile_method: str = "exact",
     ) -> None:
         super().__init__(
             estimator=estimator,
@@ -78,6 +79,7 @@ class TimeSeriesRegressor(_MapieRegressor):
             verbose=verbose,
             conformity_score=conformity_score,
             random_state=random_state,
+            quantile_method=quantile_method,
         )
 
     def _relative_conformity_scores(
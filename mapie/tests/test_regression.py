@@ -263,6 +263,58 @@ def test_valid_cv(cv: Any) -> None:
     mapie_reg.predict(X_toy, alpha=0.5)
 
 
+def test_invalid_quantile_method() -> None:
+    """Test that an invalid quantile_method raises an error."""
+    mapie_reg = _MapieRegressor(quantile_method="dummy")
+    with pytest.raises(ValueError, match=r".*'quantile_method'.*"):
+        mapie_reg.fit(X_toy, y_toy)
+
+
+@pytest.mark.parametrize("strategy", [*STRATEGIES])
+def test_results_histogram_quantile_method(strategy: str) -> None:
+    """
+    Test that intervals computed with histogram quantiles are close
+    to the exact ones, and equal with the ``"plus"`` method.
+    """
+    mapie_reg = _MapieRegressor(**STRATEGIES[strategy])
+    mapie_reg.fit(X, y)
+    _, y_pis = mapie_reg.predict(X, alpha=[0.05, 0.1])
+    mapie_reg.set_params(quantile_method="histogram")
+    _, y_pis_hist = mapie_reg.predict(X, alpha=[0.05, 0.1])
+    if STRATEGIES[strategy]["method"] == "plus":
+        np.testing.assert_array_equal(y_pis_hist, y_pis)
+    else:
+        assert (y_pis_hist[:, 0] <= y_pis[:, 0]).all()
+        assert (y_pis_hist[:, 1] >= y_pis[:, 1]).all()
+        np.testing.assert_allclose(y_pis_hist, y_pis, atol=0.1)
+
+
+def test_custom_get_bounds_without_quantile_method() -> None:
+    """
+    Test that a conformity score overriding ``get_bounds`` without the
+    ``quantile_method`` argument still works with exact quantiles.
+    """
+    class CustomConformityScore(AbsoluteConformityScore):
+        def get_bounds(  # type: ignore[override]
+            self, X, alpha_np, estimator, conformity_scores, ensemble=False,
+            method="base", optimize_beta=False, allow_infinite_bounds=False
+        ):
+            return super().get_bounds(
+                X, alpha_np, estimator, conformity_scores, ensemble=ensemble,
+                method=method, optimize_beta=optimize_beta,
+                allow_infinite_bounds=allow_infinite_bounds
+            )
+
+    mapie_reg = _MapieRegressor(
+        conformity_score=CustomConformityScore(), random_state=random_state
+    )
+    mapie_reg.fit(X, y)
+    _, y_pis = mapie_reg.predict(X, alpha=0.1)
+    mapie_reg_expected = _MapieRegressor(random_state=random_state)
+    _, y_pis_expected = mapie_reg_expected.fit(X, y).predict(X, alpha=0.1)
+    np.testing.assert_allclose(y_pis, y_pis_expected)
+
+
 @pytest.mark.parametrize("cv", [100, 200, 300])
 def test_too_large_cv(cv: Any) -> None:
     """Test that too large cv raise sklearn errors."""
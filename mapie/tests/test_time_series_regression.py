@@ -163,6 +163,15 @@ def test_invalid_agg_function(agg_function: Any) -> None:
         mapie_reg.predict(X_toy, ensemble=True)
 
 
+def test_quantile_method_set_params() -> None:
+    """Test that quantile_method is a parameter of the estimator."""
+    mapie_ts_reg = TimeSeriesRegressor(quantile_method="histogram")
+    assert mapie_ts_reg.get_params()["quantile_method"] == "histogram"
+    mapie_ts_reg.set_params(quantile_method="dummy")
+    with pytest.raises(ValueError, match=r".*'quantile_method'.*"):
+        mapie_ts_reg.fit(X_toy, y_toy)
+
+
 @pytest.mark.parametrize("strategy", [*STRATEGIES])
 @pytest.mark.parametrize("dataset", [(X, y), (X_toy, y_toy)])
 @pytest.mark.parametrize("alpha", [0.2, [0.2, 0.4], (0.2, 0.4)])
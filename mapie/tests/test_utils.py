@@ -22,7 +22,9 @@ from mapie.utils import (_check_alpha, _check_alpha_and_n_samples,
                          _check_n_jobs, _check_n_samples, _check_no_agg_cv,
                          _check_null_weight, _check_number_bins,
                          _check_split_strategy, _check_verbose,
-                         _compute_quantiles, _fit_estimator, _get_binning_groups)
+                         _compute_histogram_quantile,
+                         _compute_lower_quantile, _compute_quantiles,
+                         _fit_estimator, _get_binning_groups)
 
 X_toy = np.array([0, 1, 2, 3, 4, 5]).reshape(-1, 1)
 y_toy = np.array([5, 7, 9, 11, 13, 15])
@@ -337,6 +339,116 @@ def test_compute_quantiles_2D_and_3D(alphas: NDArray):
     assert (quantiles1 == quantiles2).all()
 
 
+@pytest.mark.parametrize("q", [0., 0.1, 0.5, 0.95, 1., np.array([0.1, 0.9])])
+@pytest.mark.parametrize("axis", [0, 1])
+def test_compute_lower_quantile_equals_nanquantile(q: float, axis: int):
+    """Test that the lower quantile matches ``np.nanquantile``
+    with and without NaN values.
+    """
+    vector = np.random.rand(50, 30)
+    expected = np.nanquantile(vector, q, axis=axis, method="lower")
+    np.testing.assert_array_equal(
+        _compute_lower_quantile(vector, q, axis=axis), expected
+    )
+    vector[::3, ::4] = np.nan
+    expected = np.nanquantile(vector, q, axis=axis, method="lower")
+    np.testing.assert_array_equal(
+        _compute_lower_quantile(vector, q, axis=axis), expected
+    )
+
+
+@pytest.mark.parametrize("q", [0., 0.1, 0.5, 0.95, 1., np.array([0.1, 0.9])])
+@pytest.mark.parametrize("axis", [0, 1])
+def test_compute_lower_quantile_reversed(q: float, axis: int):
+    """Test that the reversed lower quantile is the opposite of the lower
+    quantile of the opposite vector, with and without NaN values.
+    """
+    vector = np.random.rand(50, 30)
+    expected = -np.nanquantile(-vector, q, axis=axis, method="lower")
+    np.testing.assert_array_equal(
+        _compute_lower_quantile(vector, q, axis=axis, reversed=True), expected
+    )
+    vector[::3, ::4] = np.nan
+    expected = -np.nanquantile(-vector, q, axis=axis, method="lower")
+    np.testing.assert_array_equal(
+        _compute_lower_quantile(vector, q, axis=axis, reversed=True), expected
+    )
+
+
+@pytest.mark.parametrize("q", [0., 0.1, 0.5, 0.95, 1., np.array([0.1, 0.9])])
+@pytest.mark.parametrize("shape", [(3000,), (3000, 1)])
+def test_compute_histogram_quantile_close_to_nanquantile(
+    q: float, shape: Tuple[int, ...]
+):
+    """Test that the histogram quantile of a vector of scores is within
+    one bin width of ``np.nanquantile`` and has the same shape.
+    """
+    vector = np.random.rand(*shape)
+    expected = np.nanquantile(vector, q, axis=0, method="lower")
+    quantiles = _compute_histogram_quantile(vector, q, axis=0, n_bins=100)
+    bin_width = np.ptp(vector) / 100
+    assert quantiles.shape == expected.shape
+    np.testing.assert_allclose(quantiles, expected, atol=bin_width)
+
+
+@pytest.mark.parametrize("random_state", range(5))
+@pytest.mark.parametrize("n_samples", [7, 100, 5000])
+def test_compute_histogram_quantile_not_below_exact(
+    random_state: int, n_samples: int
+):
+    """Test that the histogram quantiles are never below the exact lower
+    quantiles, so that the coverage guarantee is preserved.
+    """
+    rng = np.random.default_rng(random_state)
+    q = np.linspace(0, 1, 51)
+    for vector in [
+        rng.exponential(size=n_samples),
+        rng.standard_normal(n_samples) * 1e3 + 0.1,
+        rng.integers(0, 5, n_samples).astype(float),
+    ]:
+        expected = np.nanquantile(vector, q, method="lower")
+        quantiles = _compute_histogram_quantile(vector, q, n_bins=10)
+        assert (quantiles >= expected).all()
+
+
+def test_compute_histogram_quantile_bins_capped_by_n_samples():
+    """Test that there are no more bins than samples: with 4 bins of
+    width 0.75, the median of [0, 1, 2, 3] is the upper edge of the second
+    bin, whereas 1000 bins would give about 1.002.
+    """
+    vector = np.array([0., 1., 2., 3.])
+    quantile = _compute_histogram_quantile(vector, 0.5, n_bins=1000)
+    np.testing.assert_allclose(quantile, 1.5)
+
+
+@pytest.mark.parametrize("q", [0.1, np.array([0.1, 0.9])])
+def test_compute_histogram_quantile_matrix_is_exact(q: float):
+    """Test that on a matrix of scores, as with the ``"plus"`` method,
+    the exact quantiles are returned with the expected shape.
+    """
+    vector = np.random.rand(200, 100)
+    expected = np.nanquantile(vector, q, axis=1, method="lower")
+    quantiles = _compute_histogram_quantile(vector, q, axis=1)
+    assert quantiles.shape == expected.shape
+    np.testing.assert_array_equal(quantiles, expected)
+
+
+def test_compute_histogram_quantile_constant_and_nan():
+    """Test the histogram quantile of constant values and its fall back
+    on the exact quantile with NaN values.
+    """
+    vector = np.ones(10)
+    np.testing.assert_array_equal(
+        _compute_histogram_quantile(vector, 0.5), 1.
+    )
+    vector = np.random.rand(10)
+    vector[0] = np.nan
+    np.testing.assert_array_equal(
+        _compute_histogram_quantile(vector, 0.5),
+        np.nanquantile(vector, 0.5, method="lower")
+    )
+
+
 @pytest.mark.parametrize("estimator", [-1, 3, 0.2])
 def test_quantile_prefit_non_iterable(estimator: Any) -> None:
     """
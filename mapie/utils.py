@@ -874,15 +874,10 @@ def _compute_quantiles(vector: NDArray, alpha: NDArray) -> NDArray:
     """
     n = len(vector)
     if len(vector.shape) <= 2:
-        quantiles_ = np.stack(
-            [
-                np.quantile(
-                    vector,
-                    ((n + 1) * (1 - _alpha)) / n,
-                    method="higher",
-                )
-                for _alpha in alpha
-            ]
+        quantiles_ = np.quantile(
+            vector,
+            ((n + 1) * (1 - np.asarray(alpha, dtype=float))) / n,
+            method="higher",
         )
 
     else:
@@ -896,6 +891,121 @@ def _compute_quantiles(vector: NDArray, alpha: NDArray) -> NDArray:
     return quantiles_
 
 
+def _compute_lower_quantile(
+    vector: NDArray,
+    q: Union[float, NDArray],
+    axis: int = 0,
+    reversed: bool = False
+) -> NDArray:
+    """Compute the lower quantile of a vector along an axis, ignoring NaNs.
+
+    Equivalent to ``np.nanquantile(vector, q, axis=axis, method="lower")``.
+    Only a few order statistics are needed, so when the vector has no NaN
+    they are selected with ``np.partition`` (linear on average) instead of
+    sorting the whole vector.
+
+    Parameters
+    ----------
+    vector: NDArray
+        Vector on which compute the quantile.
+    q: Union[float, NDArray]
+        Quantile level(s), between ``0`` and ``1``.
+    axis: int
+        The axis along which to compute the quantile.
+
+        By default ``0``.
+    reversed: bool
+        If ``True``, return the opposite of the lower quantile of
+        ``-vector``, i.e. the order statistics are counted from the largest
+        value. This avoids building ``-vector``.
+
+        By default ``False``.
+
+    Returns
+    -------
+    NDArray of shape q.shape + vector.shape without axis
+        Quantiles of the vector.
+    """
+    n = vector.shape[axis]
+    if n == 0 or np.isnan(vector).any():
+        signed = 1 - 2 * reversed
+        return signed * np.nanquantile(
+            signed * vector, q, axis=axis, method="lower"
+        )
+    q = np.asarray(q)
+    k = np.floor((n - 1) * q).astype(np.intp).ravel()
+    if reversed:
+        k = n - 1 - k
+    partitioned = np.partition(vector, np.unique(k), axis=axis)
+    quantiles_ = np.moveaxis(np.take(partitioned, k, axis=axis), axis, 0)
+    return quantiles_.reshape(q.shape + quantiles_.shape[1:])
+
+
+def _compute_histogram_quantile(
+    vector: NDArray, q: Union[float, NDArray], axis: int = 0, n_bins: int = 1000
+) -> NDArray:
+    """Approximate the lower quantile of a vector along an axis with a
+    histogram.
+
+    The values are binned once into ``min(n_bins, n_samples)`` equal-width
+    bins, then each quantile is located in the bin where the cumulative
+    count reaches its rank and the upper edge of that bin is returned.
+    The result is thus never below the exact lower quantile, so that the
+    coverage guarantee is preserved, and exceeds it by at most the width of
+    one bin.
+
+    The approximation only pays off on a single vector of scores (split
+    and jackknife/CV scores of shape (n_samples,) or (n_samples, 1)).
+    On matrices of scores, such as the (n_samples_test, n_samples_calib)
+    matrices of the ``"plus"`` method, the per-row histograms are slower
+    and much larger in memory than the exact selection, so the exact
+    quantiles of ``_compute_lower_quantile`` are returned instead. They are
+    also returned if the vector contains non-finite values.
+
+    Parameters
+    ----------
+    vector: NDArray
+        Vector on which compute the quantile.
+    q: Union[float, NDArray]
+        Quantile level(s), between ``0`` and ``1``.
+    axis: int
+        The axis along which to compute the quantile.
+
+        By default ``0``.
+    n_bins: int
+        Number of bins of the histogram.
+
+        By default ``1000``.
+
+    Returns
+    -------
+    NDArray of shape q.shape + vector.shape without axis
+        Approximated quantiles of the vector, greater than or equal to the
+        exact lower quantiles.
+    """
+    n = vector.shape[axis]
+    if vector.size != n or n == 0 or not np.isfinite(vector).all():
+        return _compute_lower_quantile(vector, q, axis=axis)
+    n_bins = min(n_bins, n)
+    q = np.asarray(q)
+    rest_shape = vector.shape[:axis] + vector.shape[axis + 1:]
+    values = vector.ravel()
+
+    # Upper edges of the bins, the last one being exactly the maximum.
+    # Each value goes to the first bin whose upper edge is not below it.
+    low, high = values.min(), values.max()
+    edges = low + (high - low) / n_bins * np.arange(1, n_bins + 1)
+    edges[-1] = high
+    bins = np.searchsorted(edges, values)
+    counts = np.bincount(bins, minlength=n_bins)
+    cum_counts = np.cumsum(counts)
+
+    # First bin whose cumulative count reaches the rank of each quantile
+    rank = np.floor((n - 1) * q) + 1
+    quantiles_ = edges[np.searchsorted(cum_counts, rank)]
+    return quantiles_.reshape(q.shape + rest_shape)
+
+
 def _get_calib_set(
     X: ArrayLike,
     y: ArrayLike,
@@ -10,6 +10,7 @@ from mapie.regression import (
     ConformalizedQuantileRegressor, JackknifeAfterBootstrapRegressor,
 )
 from mapie.classification import SplitConformalClassifier, CrossConformalClassifier
+from mapie.subsample import Subsample
 
 RANDOM_STATE = 1
 
@@ -210,3 +211,57 @@ class TestWrongMethodsOrderRaisesErrorForCrossTechniques:
 
         with pytest.raises(ValueError, match=r"fit_conformalize method already called"):
             technique.fit_conformalize(X_conformalize, y_conformalize)
+
+
+@pytest.mark.parametrize(
+    "regressor_class",
+    [
+        SplitConformalRegressor,
+        CrossConformalRegressor,
+        JackknifeAfterBootstrapRegressor,
+    ]
+)
+def test_invalid_quantile_method_raises_error(regressor_class) -> None:
+    with pytest.raises(ValueError, match=r"not valid for parameter 'quantile_method'"):
+        regressor_class(quantile_method="dummy")
+
+
+@pytest.mark.parametrize(
+    "regressor_class,params",
+    [
+        (SplitConformalRegressor, {"prefit": False}),
+        (CrossConformalRegressor, {"method": "base", "random_state": RANDOM_STATE}),
+        (
+            JackknifeAfterBootstrapRegressor,
+            {
+                "method": "minmax",
+                "resampling": Subsample(n_resamplings=30, random_state=RANDOM_STATE),
+            }
+        ),
+    ]
+)
+def test_histogram_quantile_method_contains_exact_intervals(
+    dataset_regression, regressor_class, params
+) -> None:
+    X_train, X_conformalize, X_test, y_train, y_conformalize, y_test = (
+        dataset_regression)
+    predicted_intervals = {}
+    for quantile_method in ["exact", "histogram"]:
+        regressor = regressor_class(
+            estimator=LinearRegression(),
+            confidence_level=[0.8, 0.9],
+            quantile_method=quantile_method,
+            **params
+        )
+        if regressor_class == SplitConformalRegressor:
+            regressor.fit(X_train, y_train).conformalize(
+                X_conformalize, y_conformalize
+            )
+        else:
+            regressor.fit_conformalize(X_train, y_train)
+        predicted_intervals[quantile_method] = regressor.predict_interval(X_test)[1]
+
+    exact, histogram = predicted_intervals["exact"], predicted_intervals["histogram"]
+    assert (histogram[:, 0] <= exact[:, 0]).all()
+    assert (histogram[:, 1] >= exact[:, 1]).all()
+    np.testing.assert_allclose(histogram, exact, atol=1.)